@@ -31,11 +31,38 @@ from .missing import MISSING, Missing
 __all__ = ("Asset",)
 
 if TYPE_CHECKING:
+    from typing import Any, Optional, Tuple
+
     from .http import HTTP
 
+CDN_URL = "https://cdn.discordapp.com/"
+EMOJI_PATH = "emojis/%s"
+ICON_PATH = "icons/%s/%s"
+SPLASH_PATH = "splashes/%s/%s"
+BANNER_PATH = "banners/%s/%s"
+DEFAULT_AVATAR_PATH = "avatars/%s"
+AVATAR_PATH = "avatars/%s/%s"
+GUILD_MEMBER_AVATAR_PATH = "guilds/%s/users/%savatars/%s"
+APPLICATION_ICON_PATH = "app-icons/%s/%s"
+APPLICATION_ASSET_PATH = "app-assets/%s/%s"
+ACHIEVEMENT_ICON_PATH = "app-assets/%s/achievements/%s/icons/%s"
+STICKER_PACK_BANNER_PATH = "app-assets/710982414301790216/store/%s"
+TEAM_ICON_PATH = "team-icons/%s/%s"
+STICKER_PATH = "stickers/%s"
+ROLE_ICON_PATH = "roles/%s/%s"
+SCHEDULED_EVENT_COVER_PATH = "scheduled-events/%s/%s"
+
 
 class Asset:
-    __slots__ = ("path", "animated", "file_type", "size", "http")
+    __slots__ = (
+        "_path",
+        "_arguments",
+        "_url",
+        "animated",
+        "file_type",
+        "size",
+        "http",
+    )
 
     def __init__(
         self,
@@ -45,152 +72,160 @@ class Asset:
         size: int = 0,
         *,
         http: HTTP,
+        arguments: Tuple[Any, ...] = (),
     ) -> None:
-        self.path: str = path
+        # when arguments are given, path is a %-template that is only
+        # formatted if the path or url is actually accessed
+        self._path: str = path
+        self._arguments: Tuple[Any, ...] = arguments
+        self._url: Optional[str] = None
         self.animated: bool = animated
         self.file_type: str = file_type
         self.size: int = size
         self.http: HTTP = http
 
+    @property
+    def path(self) -> str:
+        if self._arguments:
+            self._path = self._path % self._arguments
+            self._arguments = ()
+        return self._path
+
     @property
     def url(self) -> str:
-        if self.size:
-            return f"https://cdn.discordapp.com/{self.path}.{self.file_type}?size={self.size}"
-        return f"https://cdn.discordapp.com/{self.path}.{self.file_type}"
+        if self._url is None:
+            if self.size:
+                self._url = f"{CDN_URL}{self.path}.{self.file_type}?size={self.size}"
+            else:
+                self._url = f"{CDN_URL}{self.path}.{self.file_type}"
+        return self._url
 
     def clone(
         self, *, file_type: Missing[str] = MISSING, size: Missing[int] = MISSING
     ) -> Asset:
         return Asset(
-            self.path,
+            self._path,
             self.animated,
             file_type or self.file_type,
             size or self.size,
             http=self.http,
+            arguments=self._arguments,
         )
 
     @classmethod
-    def custom_emoji(cls, emoji_id: int, animated: bool, /, *, http: HTTP) -> Asset:
+    def _from_hash(
+        cls, path: str, hash: str, /, *, http: HTTP, arguments: Tuple[Any, ...]
+    ) -> Asset:
+        animated = hash.startswith("a_")
         return cls(
-            f"emojis/{emoji_id}", animated, "gif" if animated else "png", 0, http=http
+            path, animated, "gif" if animated else "png", http=http, arguments=arguments
         )
 
     @classmethod
-    def guild_icon(cls, guild_id: int, hash: str, /, *, http: HTTP) -> Asset:
-        animated = hash.startswith("a_")
+    def custom_emoji(cls, emoji_id: int, animated: bool, /, *, http: HTTP) -> Asset:
         return cls(
-            f"icons/{guild_id}/{hash}",
+            EMOJI_PATH,
             animated,
             "gif" if animated else "png",
-            0,
             http=http,
+            arguments=(emoji_id,),
         )
 
+    @classmethod
+    def guild_icon(cls, guild_id: int, hash: str, /, *, http: HTTP) -> Asset:
+        return cls._from_hash(ICON_PATH, hash, http=http, arguments=(guild_id, hash))
+
     @classmethod
     def guild_splash(cls, guild_id: int, hash: str, /, *, http: HTTP) -> Asset:
-        return cls(f"splashes/{guild_id}/{hash}", http=http)
+        return cls(SPLASH_PATH, http=http, arguments=(guild_id, hash))
 
     @classmethod
     def guild_discovery_splash(
         cls, guild_id: int, hash: str, /, *, http: HTTP
     ) -> Asset:
-        return cls(f"splashes/{guild_id}/{hash}", http=http)
+        return cls(SPLASH_PATH, http=http, arguments=(guild_id, hash))
 
     @classmethod
     def guild_banner(cls, guild_id: int, hash: str, /, *, http: HTTP) -> Asset:
-        return cls(f"banners/{guild_id}/{hash}", http=http)
+        return cls(BANNER_PATH, http=http, arguments=(guild_id, hash))
 
     @classmethod
     def user_banner(cls, user_id: int, hash: str, /, *, http: HTTP) -> Asset:
-        animated = hash.startswith("a_")
-        return cls(
-            f"banners/{user_id}/{hash}",
-            animated,
-            "gif" if animated else "png",
-            http=http,
-        )
+        return cls._from_hash(BANNER_PATH, hash, http=http, arguments=(user_id, hash))
 
     @classmethod
     def default_user_avatar(cls, discriminator: int, /, *, http: HTTP) -> Asset:
-        return cls(f"avatars/{discriminator%5}", http=http)
+        return cls(DEFAULT_AVATAR_PATH, http=http, arguments=(discriminator % 5,))
 
     @classmethod
     def user_avatar(cls, user_id: int, hash: str, /, *, http: HTTP) -> Asset:
-        animated = hash.startswith("a_")
-        return cls(
-            f"avatars/{user_id}/{hash}",
-            animated,
-            "gif" if animated else "png",
-            http=http,
-        )
+        return cls._from_hash(AVATAR_PATH, hash, http=http, arguments=(user_id, hash))
 
     @classmethod
     def guild_member_avatar(
         cls, guild_id: int, user_id: int, hash: str, /, *, http: HTTP
     ) -> Asset:
-        animated = hash.startswith("a_")
-        return cls(
-            f"guilds/{guild_id}/users/{user_id}avatars/{hash}",
-            animated,
-            "gif" if animated else "png",
+        return cls._from_hash(
+            GUILD_MEMBER_AVATAR_PATH,
+            hash,
             http=http,
+            arguments=(guild_id, user_id, hash),
         )
 
     @classmethod
     def application_icon(
         cls, application_id: int, hash: str, /, *, http: HTTP
     ) -> Asset:
-        animated = hash.startswith("a_")
-        return cls(
-            f"app-icons/{application_id}/{hash}",
-            animated,
-            "gif" if animated else "png",
-            http=http,
+        return cls._from_hash(
+            APPLICATION_ICON_PATH, hash, http=http, arguments=(application_id, hash)
         )
 
     @classmethod
     def application_cover_image(
         cls, application_id: int, hash: str, /, *, http: HTTP
     ) -> Asset:
-        return cls(f"app-icons/{application_id}/{hash}", http=http)
+        return cls(APPLICATION_ICON_PATH, http=http, arguments=(application_id, hash))
 
     @classmethod
     def application_asset(
         cls, application_id: int, hash: str, /, *, http: HTTP
     ) -> Asset:
-        return cls(f"app-assets/{application_id}/{hash}", http=http)
+        return cls(APPLICATION_ASSET_PATH, http=http, arguments=(application_id, hash))
 
     @classmethod
     def achievement_icon(
         cls, application_id: int, achievement_id: int, hash: str, /, *, http: HTTP
     ) -> Asset:
         return cls(
-            f"app-assets/{application_id}/achievements/{achievement_id}/icons/{hash}",
+            ACHIEVEMENT_ICON_PATH,
             http=http,
+            arguments=(application_id, achievement_id, hash),
         )
 
     @classmethod
     def sticker_pack_banner(cls, banner_id: int, /, *, http: HTTP) -> Asset:
-        return cls(f"app-assets/710982414301790216/store/{banner_id}", http=http)
+        return cls(STICKER_PACK_BANNER_PATH, http=http, arguments=(banner_id,))
 
     @classmethod
     def team_icon(cls, team_id: int, hash: str, /, *, http: HTTP) -> Asset:
-        return cls(f"team-icons/{team_id}/{hash}", http=http)
+        return cls(TEAM_ICON_PATH, http=http, arguments=(team_id, hash))
 
     @classmethod
     def sticker(cls, sticker_id: int, /, *, http: HTTP) -> Asset:
-        return cls(f"stickers/{sticker_id}", http=http)
+        return cls(STICKER_PATH, http=http, arguments=(sticker_id,))
 
     @classmethod
     def role_icon(cls, role_id: int, hash: str, /, *, http: HTTP) -> Asset:
-        return cls(f"roles/{role_id}/{hash}", http=http)
+        return cls(ROLE_ICON_PATH, http=http, arguments=(role_id, hash))
 
     @classmethod
     def guild_scheduled_event_cover(
         cls, event_id: int, hash: str, /, *, http: HTTP
     ) -> Asset:
-        return cls(f"scheduled-events/{event_id}/{hash}", http=http)
+        return cls(SCHEDULED_EVENT_COVER_PATH, http=http, arguments=(event_id, hash))
 
     async def read(self) -> bytes:
-        async with self.http.session.request("GET", self.url) as response:
+        async with self.http.session.request(
+            "GET", self.url, raise_for_status=True
+        ) as response:
             return await response.read()
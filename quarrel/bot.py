@@ -26,7 +26,8 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
-import contextlib
+import inspect
+import sys
 from typing import TYPE_CHECKING, Type
 
 import aiohttp
@@ -43,6 +44,9 @@ from .state import State
 
 __all__ = ("Bot",)
 
+# gateway close codes that a reconnect can't recover from
+FATAL_CLOSE_CODES = frozenset((4004, 4010, 4011, 4012, 4013, 4014))
+
 if TYPE_CHECKING:
     import re
     from typing import (
@@ -52,7 +56,9 @@ if TYPE_CHECKING:
         Dict,
         List,
         Optional,
+        Sequence,
         Set,
+        Tuple,
         TypeVar,
         Union,
     )
@@ -72,10 +78,12 @@ if TYPE_CHECKING:
     from .models import Guild, User
     from .structures.embed import Embed
     from .types import requests
+    from .types.interactions import ApplicationCommand as ApplicationCommandData
     from .types.interactions import (
         ApplicationCommandInteractionData,
         ComponentInteractionData,
         ModalSubmitInteractionData,
+        PartialApplicationCommand,
     )
 
     Command = Union[
@@ -88,60 +96,114 @@ if TYPE_CHECKING:
     M = TypeVar("M", bound=Modal[Any])
 
 
-def _get_event_loop() -> asyncio.AbstractEventLoop:
-    try:
-        return asyncio.get_running_loop()
-    except RuntimeError:
-        return asyncio.get_event_loop_policy().get_event_loop()
-
-
 class Bot:
+    __slots__ = (
+        "application_id",
+        "token",
+        "intents",
+        "eager_tasks",
+        "_loop",
+        "session",
+        "http",
+        "listeners",
+        "state",
+        "user",
+        "commands",
+        "registered_commands",
+        "components",
+        "regex_components",
+        "regex_components_matcher",
+        "modals",
+        "regex_modals",
+        "regex_modals_matcher",
+        "event_handler",
+        "gateway_handler",
+        "_on_handlers",
+        "_interaction_processors",
+        "_pending_timeouts",
+        # bots are commonly subclassed or given extra attributes by users
+        "__dict__",
+    )
+
     def __init__(
         self,
         application_id: int,
         token: str,
         intents: Intents,
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        *,
+        eager_tasks: bool = False,
     ):
         self.application_id: int = application_id
         self.token: str = token
         self.intents: Intents = intents
-
-        self.loop: asyncio.AbstractEventLoop = loop or _get_event_loop()
+        # opt in to asyncio.eager_task_factory (3.12+) for the duration of
+        # run(), it applies to every task created on the loop, not just the
+        # bot's, so it changes scheduling order for the host application too
+        self.eager_tasks: bool = eager_tasks
+
+        # resolved from the running loop in run() unless one is given
+        self._loop: Optional[asyncio.AbstractEventLoop] = loop
+        # components and modals added before the loop is known start their
+        # timeouts once the bot is running
+        self._pending_timeouts: Optional[List[Union[Component, Modal[Any]]]] = (
+            [] if loop is None else None
+        )
         self.session: aiohttp.ClientSession
         self.http: HTTP
-        self.listeners: Dict[str, Set[CoroutineFunction]] = {}
+        self.listeners: Dict[str, Tuple[CoroutineFunction, ...]] = {}
         self.state: State = State(self)
         self.user: Missing[User] = MISSING
         self.commands: Set[Command] = set()
-        self.registered_commands: Dict[int, Command] = {}
+        self.registered_commands: Dict[str, Command] = {}
         self.components: Dict[str, Component] = {}
         self.regex_components: Dict[re.Pattern[str], Component] = {}
+        self.regex_components_matcher: utils.PatternMatcher[
+            Component
+        ] = utils.PatternMatcher(self.regex_components)
         self.modals: Dict[str, Modal[Any]] = {}
         self.regex_modals: Dict[re.Pattern[str], Modal[Any]] = {}
-        self.event_handler = EventHandler(self, self.loop)
+        self.regex_modals_matcher: utils.PatternMatcher[
+            Modal[Any]
+        ] = utils.PatternMatcher(self.regex_modals)
+        self.event_handler = EventHandler(self)
+        # event names are interned so lookups with the string literals
+        # passed to dispatch hit the identity fast path
+        self._on_handlers: Dict[str, CoroutineFunction] = {
+            sys.intern(name[3:]): getattr(self, name)
+            for name in dir(type(self))
+            if name.startswith("on_")
+        }
+        # autocomplete interactions are not processed yet
+        self._interaction_processors: Dict[
+            InteractionType, Callable[[Interaction], Coroutine[Any, Any, None]]
+        ] = {
+            InteractionType.APPLICATION_COMMAND: self.process_application_command,
+            InteractionType.MESSAGE_COMPONENT: self.process_component,
+            InteractionType.MODAL_SUBMIT: self.process_modal_submit,
+        }
 
     @property
     def gateway(self) -> Gateway:
         return self.gateway_handler.gateway
 
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            raise RuntimeError("The bot has no event loop until it is running")
+        return self._loop
+
     async def connect(self) -> None:
         self.gateway_handler = await GatewayHandler.connect(self)
+        handle = self.event_handler.handle
         while True:
             try:
                 async for message in self.gateway_handler:
-                    self.event_handler.handle(message["t"], message["d"])
+                    handle(message["t"], message["d"])
             except UnknownGatewayMessageType:
                 pass
             except GatewayClosure as e:
-                if e.close_code in {
-                    4004,
-                    4010,
-                    4011,
-                    4012,
-                    4013,
-                    4014,
-                }:
+                if e.close_code in FATAL_CLOSE_CODES:
                     raise
                 self.state.clear_for_reconnect()
                 await self.gateway_handler.reconnect()
@@ -150,19 +212,45 @@ class Bot:
                 await self.gateway_handler.reconnect()
 
     async def run(self) -> None:
-        self.session: aiohttp.ClientSession = aiohttp.ClientSession()
-        self.http: HTTP = HTTP(self.session, self.token, self.application_id, self.loop)
-        await self.register_application_commands()
-        await self.connect()
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        # tasks for listeners that finish without suspending never have to
+        # wait for a trip through the scheduler
+        eager = (
+            self.eager_tasks
+            and hasattr(asyncio, "eager_task_factory")
+            and self.loop.get_task_factory() is None
+        )
+        if eager:
+            self.loop.set_task_factory(asyncio.eager_task_factory)  # type: ignore
+        try:
+            if self._pending_timeouts is not None:
+                for item in self._pending_timeouts:
+                    item.start_timeout(self)
+                self._pending_timeouts = None
+            # one session for the lifetime of the bot, shared by HTTP, the
+            # gateway, and every Asset through HTTP.session
+            self.session: aiohttp.ClientSession = HTTP.build_session()
+            self.http: HTTP = HTTP(
+                self.session, self.token, self.application_id, self.loop
+            )
+            await self.register_application_commands()
+            await self.connect()
+        finally:
+            if eager:
+                self.loop.set_task_factory(None)
 
     def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
-        with contextlib.suppress(AttributeError):
-            coro = getattr(self, f"on_{event}")
+        coro = self._on_handlers.get(event)
+        if coro is not None:
             self.loop.create_task(coro(*args, **kwargs))
         if listeners := self.listeners.get(event):
             for listener in listeners:
                 self.loop.create_task(self._dispatch(event, listener, *args, **kwargs))
 
+    def has_listeners(self, event: str, /) -> bool:
+        return event in self._on_handlers or event in self.listeners
+
     async def _dispatch(
         self, event: str, coro: CoroutineFunction, *args: Any, **kwargs: Any
     ) -> None:
@@ -173,27 +261,42 @@ class Bot:
 
     def listener(self, name: Missing[str] = MISSING) -> Callable[[CF], CF]:
         def decorator(coro: CF) -> CF:
-            if not asyncio.iscoroutinefunction(coro):
+            if not inspect.iscoroutinefunction(coro):
                 raise TypeError("Decorated function must be a coroutine function")
-            if not name and not coro.__name__.startswith("on_"):
-                raise ValueError(
-                    "Decorated function must have a name starting with 'on_'"
-                )
-            event = name or coro.__name__[3:]
-            if listeners := self.listeners.get(event):
-                listeners.add(coro)
+            if name:
+                event = sys.intern(name)
             else:
-                self.listeners[event] = {coro}
+                coro_name = coro.__name__
+                if not coro_name.startswith("on_"):
+                    raise ValueError(
+                        "Decorated function must have a name starting with 'on_'"
+                    )
+                event = sys.intern(coro_name[3:])
+            listeners = self.listeners.get(event, ())
+            if coro not in listeners:
+                self.listeners[event] = listeners + (coro,)
             return coro
 
         return decorator
 
+    def remove_listener(
+        self, coro: CoroutineFunction, name: Missing[str] = MISSING
+    ) -> Bot:
+        event = name or coro.__name__[3:]
+        listeners = tuple(i for i in self.listeners.get(event, ()) if i is not coro)
+        if listeners:
+            self.listeners[event] = listeners
+        else:
+            self.listeners.pop(event, None)
+        return self
+
     def event(self, coro: CF) -> CF:
-        if not asyncio.iscoroutinefunction(coro):
+        if not inspect.iscoroutinefunction(coro):
             raise TypeError("Decorated function must be a coroutine function")
-        if not coro.__name__.startswith("on_"):
+        coro_name = coro.__name__
+        if not coro_name.startswith("on_"):
             raise ValueError("Decorated function must have a name starting with 'on_'")
-        setattr(self, coro.__name__, coro)
+        self._on_handlers[sys.intern(coro_name[3:])] = coro
         return coro
 
     def command(self, command: COM) -> COM:
@@ -211,9 +314,10 @@ class Bot:
     def add_component(self, component: Component) -> Bot:
         if component.pattern is not MISSING:
             self.regex_components[component.pattern] = component
+            self.regex_components_matcher.invalidate()
         elif component.custom_id is not MISSING:
             self.components[component.custom_id] = component
-            component.start_timeout(self)
+            self._start_timeout(component)
         return self
 
     def add_component_from_class(self, component: Type[C]) -> Type[C]:
@@ -227,9 +331,10 @@ class Bot:
     def add_modal(self, modal: Modal[Any]) -> Bot:
         if modal.pattern is not MISSING:
             self.regex_modals[modal.pattern] = modal
+            self.regex_modals_matcher.invalidate()
         elif modal.custom_id is not MISSING:
             self.modals[modal.custom_id] = modal
-            modal.start_timeout(self)
+            self._start_timeout(modal)
         return self
 
     def add_modal_from_class(self, modal: Type[M]) -> Type[M]:
@@ -237,93 +342,122 @@ class Bot:
         self.add_modal(modal())  # type: ignore
         return modal
 
+    def _start_timeout(self, item: Union[Component, Modal[Any]], /) -> None:
+        if self._pending_timeouts is None:
+            item.start_timeout(self)
+        else:
+            self._pending_timeouts.append(item)
+
     async def register_application_commands(self) -> None:
-        commands = {i.name: i for i in self.commands if i.global_}
-        if commands:
-            registered = await self.http.bulk_upsert_global_application_commands(
-                [i.to_payload() for i in commands.values()]
-            )
-            for command in registered:
-                self.registered_commands[int(command["id"])] = commands[command["name"]]
-        guild_commands: Dict[int, List[Command]] = {}
+        global_commands: Dict[str, Command] = {}
+        global_payloads: List[PartialApplicationCommand] = []
+        guild_commands: Dict[Tuple[str, str], Command] = {}
+        guild_payloads: Dict[int, List[PartialApplicationCommand]] = {}
         for command in self.commands:
+            payload = command.to_payload()
+            if command.global_:
+                global_commands[command.name] = command
+                global_payloads.append(payload)
             for guild in command.guilds:
-                if (commands_ := guild_commands.get(guild)) is None:
-                    guild_commands[guild] = [command]
+                guild_commands[(str(guild), command.name)] = command
+                if (payloads := guild_payloads.get(guild)) is None:
+                    guild_payloads[guild] = [payload]
                 else:
-                    commands_.append(command)
-        commands = {(j, i.name): i for i in self.commands for j in i.guilds}
-        for guild, commands_ in guild_commands.items():
-            registered = await self.http.bulk_upsert_guild_application_commands(
-                guild, [i.to_payload() for i in commands_]
+                    payloads.append(payload)
+        if global_payloads:
+            registered = await self.http.bulk_upsert_global_application_commands(
+                global_payloads
             )
             for command in registered:
-                self.registered_commands[int(command["id"])] = commands[
-                    (int(command.get("guild_id", 0)), command["name"])
+                self.registered_commands[str(command["id"])] = global_commands[
+                    command["name"]
+                ]
+        # bounded so bots in many guilds don't run straight into the global ratelimit
+        semaphore = asyncio.Semaphore(10)
+        responses = await asyncio.gather(
+            *(
+                self._upsert_guild_application_commands(semaphore, guild, payloads)
+                for guild, payloads in guild_payloads.items()
+            )
+        )
+        for registered in responses:
+            for command in registered:
+                self.registered_commands[str(command["id"])] = guild_commands[
+                    (str(command.get("guild_id", "")), command["name"])
                 ]
 
+    async def _upsert_guild_application_commands(
+        self,
+        semaphore: asyncio.Semaphore,
+        guild: int,
+        payloads: List[PartialApplicationCommand],
+        /,
+    ) -> Sequence[ApplicationCommandData]:
+        async with semaphore:
+            return await self.http.bulk_upsert_guild_application_commands(
+                guild, payloads
+            )
+
     async def on_interaction_create(self, interaction: Interaction) -> None:
         await self.process_interaction(interaction)
 
     async def process_interaction(self, interaction: Interaction) -> None:
-        if interaction.type is InteractionType.APPLICATION_COMMAND:
-            # will be an application command data, for some reason the type
-            # checker things it is a component when the component processing
-            # section is uncommented
-            data: ApplicationCommandInteractionData = interaction.data  # type: ignore
-            command = self.registered_commands.get(int(data["id"]))  # type: ignore
-            if command is not None:
-                try:
-                    await command.run_command(interaction)
-                except Exception as e:
-                    utils.print_exception_with_header(
-                        f"Ignoring exception while running command {command.name}:", e
-                    )
-        elif interaction.type is InteractionType.MESSAGE_COMPONENT:
-            data: ComponentInteractionData = interaction.data  # type: ignore
-            custom_id = data["custom_id"]
-            component = self.components.get(custom_id)
-            if component is not None:
-                try:
-                    return await component.run_component(interaction, {})
-                except Exception as e:
-                    return utils.print_exception_with_header(
-                        f"Ignoring exception while processing component {component}:", e
-                    )
-            for pattern, component in self.regex_components.items():
-                match = pattern.match(custom_id)
-                if match is not None:
-                    try:
-                        return await component.run_component(
-                            interaction, match.groupdict()
-                        )
-                    except Exception as e:
-                        return utils.print_exception_with_header(
-                            f"Ignoring exception while processing component {component}:",
-                            e,
-                        )
-        elif interaction.type is InteractionType.APPLICATION_COMMAND_AUTOCOMPLETE:
-            ...
-        elif interaction.type is InteractionType.MODAL_SUBMIT:
-            data: ModalSubmitInteractionData = interaction.data  # type: ignore
-            custom_id = data["custom_id"]
-            modal = self.modals.get(custom_id)
-            if modal is not None:
-                try:
-                    return await modal.run_modal(interaction, {})
-                except Exception as e:
-                    return utils.print_exception_with_header(
-                        f"Ignoring exception while processing modal {modal}:", e
-                    )
-            for pattern, modal in self.regex_modals.items():
-                match = pattern.match(custom_id)
-                if match is not None:
-                    try:
-                        return await modal.run_modal(interaction, match.groupdict())
-                    except Exception as e:
-                        return utils.print_exception_with_header(
-                            f"Ignoring exception while processing modal {modal}:", e
-                        )
+        processor = self._interaction_processors.get(interaction.type)
+        if processor is not None:
+            await processor(interaction)
+
+    async def process_application_command(self, interaction: Interaction) -> None:
+        data: ApplicationCommandInteractionData = interaction.data  # type: ignore
+        command = self.registered_commands.get(str(data["id"]))
+        if command is not None:
+            try:
+                await command.run_command(interaction)
+            except Exception as e:
+                utils.print_exception_with_header(
+                    f"Ignoring exception while running command {command.name}:", e
+                )
+
+    async def process_component(self, interaction: Interaction) -> None:
+        data: ComponentInteractionData = interaction.data  # type: ignore
+        custom_id = data["custom_id"]
+        component = self.components.get(custom_id)
+        if component is not None:
+            try:
+                return await component.run_component(interaction, {})
+            except Exception as e:
+                return utils.print_exception_with_header(
+                    f"Ignoring exception while processing component {component}:", e
+                )
+        match = self.regex_components_matcher.match(custom_id)
+        if match is not None:
+            component, groups = match
+            try:
+                return await component.run_component(interaction, groups)
+            except Exception as e:
+                return utils.print_exception_with_header(
+                    f"Ignoring exception while processing component {component}:", e
+                )
+
+    async def process_modal_submit(self, interaction: Interaction) -> None:
+        data: ModalSubmitInteractionData = interaction.data  # type: ignore
+        custom_id = data["custom_id"]
+        modal = self.modals.get(custom_id)
+        if modal is not None:
+            try:
+                return await modal.run_modal(interaction, {})
+            except Exception as e:
+                return utils.print_exception_with_header(
+                    f"Ignoring exception while processing modal {modal}:", e
+                )
+        match = self.regex_modals_matcher.match(custom_id)
+        if match is not None:
+            modal, groups = match
+            try:
+                return await modal.run_modal(interaction, groups)
+            except Exception as e:
+                return utils.print_exception_with_header(
+                    f"Ignoring exception while processing modal {modal}:", e
+                )
 
     async def edit_message(
         self,
@@ -24,7 +24,7 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from enum import Enum
+from enum import IntEnum
 
 __all__ = (
     "GuildDefaultMessageNotificationLevel",
@@ -48,23 +48,23 @@ __all__ = (
 )
 
 
-class GuildDefaultMessageNotificationLevel(Enum):
+class GuildDefaultMessageNotificationLevel(IntEnum):
     ALL_MESSAGES = 0
     ONLY_MENTIONS = 1
 
 
-class GuildExplicitContentFilter(Enum):
+class GuildExplicitContentFilter(IntEnum):
     DISABLED = 0
     MEMBERS_WITHOUT_ROLES = 1
     ALL_MEMBERS = 2
 
 
-class GuildMFALevel(Enum):
+class GuildMFALevel(IntEnum):
     NONE = 0
     ELEVATED = 1
 
 
-class GuildVerificationLevel(Enum):
+class GuildVerificationLevel(IntEnum):
     NONE = 0
     LOW = 1
     MEDIUM = 2
@@ -72,32 +72,32 @@ class GuildVerificationLevel(Enum):
     VERY_HIGH = 4
 
 
-class GuildNSFWLevel(Enum):
+class GuildNSFWLevel(IntEnum):
     NONE = 0
     EXPLICIT = 1
     SAFE = 2
     AGE_RESTRICTED = 3
 
 
-class GuildPremiumTier(Enum):
+class GuildPremiumTier(IntEnum):
     NONE = 0
     TIER_1 = 1
     TIER_2 = 2
     TIER_3 = 3
 
 
-class StickerType(Enum):
+class StickerType(IntEnum):
     STANDARD = 1
     GUILD = 2
 
 
-class StickerFormat(Enum):
+class StickerFormat(IntEnum):
     PNG = 1
     APNG = 2
     LOTTIE = 3
 
 
-class ChannelType(Enum):
+class ChannelType(IntEnum):
     GUILD_TEXT = 0
     DM = 1
     GUILD_VOICE = 2
@@ -111,7 +111,7 @@ class ChannelType(Enum):
     GUILD_STAGE_VOICE = 13
 
 
-class ApplicationCommandOptionType(Enum):
+class ApplicationCommandOptionType(IntEnum):
     SUB_COMMAND = 1
     SUB_COMMAND_GROUP = 2
     STRING = 3
@@ -124,13 +124,13 @@ class ApplicationCommandOptionType(Enum):
     NUMBER = 10
 
 
-class ApplicationCommandType(Enum):
+class ApplicationCommandType(IntEnum):
     CHAT_INPUT = 1
     USER = 2
     MESSAGE = 3
 
 
-class InteractionType(Enum):
+class InteractionType(IntEnum):
     PING = 1
     APPLICATION_COMMAND = 2
     MESSAGE_COMPONENT = 3
@@ -138,14 +138,14 @@ class InteractionType(Enum):
     MODAL_SUBMIT = 5
 
 
-class ComponentType(Enum):
+class ComponentType(IntEnum):
     ACTION_ROW = 1
     BUTTON = 2
     SELECT_MENU = 3
     TEXT_INPUT = 4
 
 
-class ButtonStyle(Enum):
+class ButtonStyle(IntEnum):
     PRIMARY = 1
     BLURPLE = 1
     SECONDARY = 2
@@ -158,7 +158,7 @@ class ButtonStyle(Enum):
     LINK = 5
 
 
-class InteractionCallbackType(Enum):
+class InteractionCallbackType(IntEnum):
     PONG = 1
     CHANNEL_MESSAGE_WITH_SOURCE = 4
     DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE = 5
@@ -168,7 +168,7 @@ class InteractionCallbackType(Enum):
     MODAL = 9
 
 
-class Color(Enum):
+class Color(IntEnum):
     TEAL = 0x1ABC9C
     DARK_TEAL = 0x11806A
     BRAND_GREEN = 0x57F287
@@ -196,11 +196,11 @@ class Color(Enum):
     YELLOW = 0xFEE75C
 
 
-class TextInputStyle(Enum):
+class TextInputStyle(IntEnum):
     SHORT = 1
     PARAGRAPH = 2
 
 
-class PermissionOverwriteType(Enum):
+class PermissionOverwriteType(IntEnum):
     ROLE = 0
     MEMBER = 1
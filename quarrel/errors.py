@@ -92,6 +92,8 @@ class CommandError(QuarrelException):
 
 
 class ConversionError(CommandError):
+    __slots__ = ("option", "value", "errors")
+
     def __init__(self, option: Option, value: Any, errors: List[Exception]) -> None:
         self.option: Option = option
         self.value: Missing[Any] = value
@@ -99,6 +101,8 @@ class ConversionError(CommandError):
 
 
 class OptionError(CommandError):
+    __slots__ = ("option", "value", "error")
+
     def __init__(self, option: Option, value: Missing[Any], error: Exception) -> None:
         self.option: Option = option
         self.value: Missing[Any] = value
@@ -106,5 +110,7 @@ class OptionError(CommandError):
 
 
 class CheckError(CommandError):
+    __slots__ = ("error",)
+
     def __init__(self, error: Exception) -> None:
         self.error: Exception = error
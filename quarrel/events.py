@@ -26,10 +26,9 @@ from __future__ import annotations
 
 import asyncio
 import copy
-import inspect
-from typing import TYPE_CHECKING
+import sys
+from typing import TYPE_CHECKING, ClassVar
 
-from . import utils
 from .interactions import Interaction
 from .missing import MISSING
 from .models import Guild, Member, Role, User
@@ -38,7 +37,7 @@ from .models.channel import GuildChannelFactory
 __all__ = ("EventHandler",)
 
 if TYPE_CHECKING:
-    from typing import Any, Callable, Dict, List, Optional, Tuple
+    from typing import Any, Callable, Dict, List, Optional
 
     from .bot import Bot
     from .models.channel import GuildChannel, Thread
@@ -55,80 +54,126 @@ if TYPE_CHECKING:
 
 
 class EventHandler:
-    def __init__(
-        self, bot: Bot, loop: asyncio.AbstractEventLoop, *, chunk_guilds: bool = True
-    ) -> None:
+    __slots__ = (
+        "bot",
+        "state",
+        "handlers",
+        "pending_guilds",
+        "guild_received",
+        "chunk_guilds",
+        "chunks_queue",
+        "ready",
+    )
+    _handler_names: ClassVar[Dict[str, str]]
+
+    def __init__(self, bot: Bot, *, chunk_guilds: bool = True) -> None:
         self.bot: Bot = bot
         self.state: State = bot.state
-        self.loop: asyncio.AbstractEventLoop = loop
 
+        cls = type(self)
+        # the name scan is done once per class, every instance only binds
+        names = cls.__dict__.get("_handler_names")
+        if names is None:
+            names = cls._handler_names = {
+                sys.intern(name[7:].upper()): name
+                for name in dir(cls)
+                if name.startswith("handle_")
+            }
         self.handlers: Dict[str, Callable[[Dict[str, Any]], None]] = {
-            name[7:].upper(): func
-            for name, func in inspect.getmembers(self)
-            if name.startswith("handle_")
+            event: getattr(self, name) for event, name in names.items()
         }
 
-        self.guild_queue: Optional[asyncio.Queue[Guild]] = None
+        # guilds streamed in after READY, until the handshake completes
+        self.pending_guilds: Optional[List[Guild]] = None
+        # created with pending_guilds so it binds to the running loop on 3.8/3.9
+        self.guild_received: Optional[asyncio.Event] = None
         self.chunk_guilds: bool = chunk_guilds
-        self.chunks_queue: Dict[Tuple[int, str], asyncio.Queue[GuildMembersChunk]] = {}
+        self.chunks_queue: Dict[str, asyncio.Queue[GuildMembersChunk]] = {}
         self.ready: Optional[asyncio.Event] = asyncio.Event()
 
     def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
         self.bot.dispatch(event, *args, **kwargs)
 
-    def handle(self, event: str, data: Dict[str, Any]):
-        if event == "READY":
-            self.bot.gateway_handler.session_id = data["session_id"]
-        elif event == "RESUMED":
-            ...
+    def _guild_from_data(self, data: Any) -> Optional[Guild]:
+        guild_id = data.get("guild_id")
+        return None if guild_id is None else self.state.get_guild(int(guild_id))
 
+    def handle(self, event: str, data: Dict[str, Any]):
         handler = self.handlers.get(event)
         if handler is not None:
             handler(data)
 
     def handle_ready(self, data: Dict[str, Any]) -> None:
+        self.bot.gateway_handler.session_id = data["session_id"]
         self.bot.user = User(data["user"], self.state)
         self.state.add_user(self.bot.user)
-        if self.guild_queue is None:
-            self.guild_queue = asyncio.Queue()
+        if self.pending_guilds is None:
+            self.pending_guilds = []
+        if self.guild_received is None:
+            self.guild_received = asyncio.Event()
         if self.ready is None:
             self.ready = asyncio.Event()
         self.bot.loop.create_task(self.async_handle_ready(data))
 
     async def async_handle_ready(self, data: Dict[str, Any]) -> None:
-        if self.guild_queue is None:
-            self.guild_queue = asyncio.Queue()
+        if self.pending_guilds is None:
+            self.pending_guilds = []
+        if self.guild_received is None:
+            self.guild_received = asyncio.Event()
         num_guilds = len(data.get("guilds", []))
-        queue = self.guild_queue
+        pending = self.pending_guilds
+        received = self.guild_received
         guilds: List[Guild] = []
-
-        while True:
-            try:
-                guild = await asyncio.wait_for(queue.get(), timeout=15)
-            except asyncio.TimeoutError:
-                break
+        count = 0
+
+        # guilds arrive in bursts, so they are taken off the list in batches
+        # and the event is only waited on once the list runs dry
+        while count < num_guilds:
+            if not pending:
+                received.clear()
+                try:
+                    await asyncio.wait_for(received.wait(), timeout=15)
+                except asyncio.TimeoutError:
+                    break
+            count += len(pending)
             if self.chunk_guilds:
-                asyncio.create_task(guild.chunk())
-            guilds.append(guild)
-            if len(guilds) == num_guilds:
-                break
-        for guild in guilds:
-            await guild.wait_until_chunked()
+                for guild in pending:
+                    asyncio.create_task(guild.chunk())
+                guilds.extend(pending)
+            else:
+                # nothing to wait on, the guild is usable as soon as it arrives
+                for guild in pending:
+                    self.state.add_guild(guild)
+                    self.dispatch("guild_available", guild)
+            pending.clear()
+        # the chunk requests all run concurrently, so make each guild available
+        # as soon as its own members are in rather than in arrival order
+        for future in asyncio.as_completed(
+            [self._wait_until_chunked(guild) for guild in guilds]
+        ):
+            guild = await future
             self.state.add_guild(guild)
             self.dispatch("guild_available", guild)
 
-        self.guild_queue = None
+        self.pending_guilds = None
+        self.guild_received = None
         self.dispatch("ready")
         if self.ready:
             self.ready.set()
             self.ready = None
 
+    async def _wait_until_chunked(self, guild: Guild) -> Guild:
+        await guild.wait_until_chunked()
+        return guild
+
     def handle_resumed(self, data: Dict[str, Any]) -> None:
         ...
 
     def handle_guild_create(self, data: GuildData) -> None:
-        if self.guild_queue is not None and data.get("unavailable") is False:
-            self.guild_queue.put_nowait(Guild(data, self.state))
+        if self.pending_guilds is not None and data.get("unavailable") is False:
+            self.pending_guilds.append(Guild(data, self.state))
+            if self.guild_received is not None:
+                self.guild_received.set()
             return
 
         if data.get("unavailable") is True:
@@ -159,8 +204,10 @@ class EventHandler:
         self.dispatch("guild_create", guild)
 
     def handle_guild_members_chunk(self, chunk: GuildMembersChunk) -> None:
-        queue = self.chunks_queue[(int(chunk["guild_id"]), chunk.get("nonce", ""))]
-        queue.put_nowait(chunk)
+        # nonces are unique per request, so they alone identify the waiting guild
+        queue = self.chunks_queue.get(chunk.get("nonce", ""))
+        if queue is not None:
+            queue.put_nowait(chunk)
 
     def handle_interaction_create(self, data: InteractionData) -> None:
         self.dispatch("interaction_create", Interaction(data, self.state))
@@ -171,8 +218,7 @@ class EventHandler:
             self.dispatch("user_update", self.bot.user)
 
     def handle_channel_create(self, data: ChannelData) -> None:
-        guild_id = utils.get_int_or_missing(data.get("guild_id", MISSING))
-        guild = self.state.get_guild(guild_id or 0)
+        guild = self._guild_from_data(data)
         if guild is not None:
             channel = GuildChannelFactory(data, guild, self.state)
             if channel is not None:
@@ -180,16 +226,14 @@ class EventHandler:
                 self.dispatch("channel_create", channel)
 
     def handle_channel_delete(self, data: ChannelData) -> None:
-        guild_id = utils.get_int_or_missing(data.get("guild_id", MISSING))
-        guild = self.state.get_guild(guild_id or 0)
+        guild = self._guild_from_data(data)
         if guild is not None:
             channel = guild._channels.pop(int(data["id"]), None)
             if channel is not None:
                 self.dispatch("channel_delete", channel)
 
     def handle_channel_update(self, data: ChannelData) -> None:
-        guild_id = utils.get_int_or_missing(data.get("guild_id", MISSING))
-        guild = self.state.get_guild(guild_id or 0)
+        guild = self._guild_from_data(data)
         if guild is not None:
             channel: Optional[GuildChannel] = guild._channels.get(int(data["id"]))
             if channel is not None:
@@ -199,8 +243,7 @@ class EventHandler:
                 self.dispatch("channel_update", old, channel)
 
     def handle_thread_create(self, data: ThreadData) -> None:
-        guild_id = utils.get_int_or_missing(data.get("guild_id", MISSING))
-        guild = self.state.get_guild(guild_id or 0)
+        guild = self._guild_from_data(data)
         if guild is not None:
             channel = GuildChannelFactory(data, guild, self.state)
             if channel is not None:
@@ -210,16 +253,14 @@ class EventHandler:
                     self.dispatch("thread_create", channel)
 
     def handle_thread_delete(self, data: ThreadData) -> None:
-        guild_id = utils.get_int_or_missing(data.get("guild_id", MISSING))
-        guild = self.state.get_guild(guild_id or 0)
+        guild = self._guild_from_data(data)
         if guild is not None:
             channel = guild._channels.pop(int(data["id"]), None)
             if channel is not None:
                 self.dispatch("thread_delete", channel)
 
     def handle_thread_update(self, data: ThreadData) -> None:
-        guild_id = utils.get_int_or_missing(data.get("guild_id", MISSING))
-        guild = self.state.get_guild(guild_id or 0)
+        guild = self._guild_from_data(data)
         if guild is not None:
             # guild.get_channel union issues again
             channel: Optional[Thread] = guild.get_channel(int(data["id"]))  # type: ignore
@@ -229,24 +270,21 @@ class EventHandler:
                 self.dispatch("thread_update", old, channel)
 
     def handle_guild_member_add(self, data: MemberData) -> None:
-        guild_id = utils.get_int_or_missing(data.get("guild_id", MISSING))
-        guild = self.state.get_guild(guild_id or 0)
+        guild = self._guild_from_data(data)
         if guild is not None:
             member = Member(data, MISSING, guild, self.state)
             guild._members[member.id] = member
             self.dispatch("member_join", member)
 
     def handle_guild_member_remove(self, data: MemberData) -> None:
-        guild_id = utils.get_int_or_missing(data.get("guild_id", MISSING))
-        guild = self.state.get_guild(guild_id or 0)
+        guild = self._guild_from_data(data)
         if guild is not None:
             member = guild._members.pop(int(data.get("user", {"id": 0})["id"]), None)
             if member is not None:
                 self.dispatch("member_remove", member)
 
     def handle_guild_member_update(self, data: MemberData) -> None:
-        guild_id = utils.get_int_or_missing(data.get("guild_id", MISSING))
-        guild = self.state.get_guild(guild_id or 0)
+        guild = self._guild_from_data(data)
         if guild is not None:
             member = guild.get_member(int(data.get("user", {"id": 0})["id"]))
             if member is not None:
@@ -255,24 +293,21 @@ class EventHandler:
                 self.dispatch("member_update", old, member)
 
     def handle_guild_role_create(self, data: RoleData) -> None:
-        guild_id = utils.get_int_or_missing(data.get("guild_id", MISSING))
-        guild = self.state.get_guild(guild_id or 0)
+        guild = self._guild_from_data(data)
         if guild is not None:
             role = Role(data, guild, self.state)
             guild._roles[role.id] = role
             self.dispatch("role_create", role)
 
     def handle_guild_role_delete(self, data: RoleData) -> None:
-        guild_id = utils.get_int_or_missing(data.get("guild_id", MISSING))
-        guild = self.state.get_guild(guild_id or 0)
+        guild = self._guild_from_data(data)
         if guild is not None:
             role = guild._roles.pop(int(data["id"]), None)
             if role is not None:
                 self.dispatch("role_delete", role)
 
     def handle_guild_role_update(self, data: RoleData) -> None:
-        guild_id = utils.get_int_or_missing(data.get("guild_id", MISSING))
-        guild = self.state.get_guild(guild_id or 0)
+        guild = self._guild_from_data(data)
         if guild is not None:
             role = guild._roles.get(int(data["id"]))
             if role is not None:
@@ -281,12 +316,16 @@ class EventHandler:
                 self.dispatch("role_update", old, role)
 
     def handle_presence_update(self, data: PartialPresenceUpdateData) -> None:
-        guild_id = utils.get_int_or_missing(data.get("guild_id", MISSING))
-        guild = self.state.get_guild(guild_id or 0)
+        guild = self._guild_from_data(data)
         if guild is not None:
             user_id = int(data["user"]["id"])
             member = guild.get_member(user_id)
             if member is not None:
+                # presence updates are by far the most frequent event, only pay
+                # for the snapshot when something will receive it
+                if not self.bot.has_listeners("user_update"):
+                    member.user.update_all_optional(data["user"])
+                    return
                 old = copy.copy(member.user)
                 user = member.user.update_all_optional(data["user"])
                 self.dispatch("user_update", old, user)
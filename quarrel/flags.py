@@ -24,55 +24,103 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, overload
+from typing import TYPE_CHECKING, ClassVar, overload
 
 __all__ = ("Intents", "SystemChannelFlags", "Permissions")
 
 if TYPE_CHECKING:
-    from typing import Any, Callable, Optional, Type, TypeVar
+    from typing import Any, Callable, Dict, Optional, Type, TypeVar
 
     T = TypeVar("T", bound="Flags")
 
 
-class flag:  # noqa: N801
-    def __init__(self, func: Callable[[Any], int]):
-        self.flag: int = func(None)
-        self.__doc__: Optional[str] = func.__doc__
+if TYPE_CHECKING:
+
+    class flag:  # noqa: N801
+        flag: int
+
+        def __init__(self, func: Callable[[Any], int]) -> None:
+            ...
+
+        @overload
+        def __get__(self, instance: None, owner: Type[T]) -> T:
+            ...
+
+        @overload
+        def __get__(self, instance: Flags, owner: Type[T]) -> bool:
+            ...
+
+        def __get__(self, instance: Optional[Flags], owner: Type[T]) -> Any:
+            ...
+
+        def __set__(self, instance: Flags, value: bool) -> None:
+            ...
 
-    @overload
-    def __get__(self, instance: None, owner: Type[T]) -> T:
-        ...
+else:
 
-    @overload
-    def __get__(self, instance: Flags, owner: Type[T]) -> bool:
-        ...
+    class flag(property):  # noqa: N801
+        # a property with the mask closed over, reads go through the C-level
+        # property.__get__ instead of a Python-level __get__ loading self.flag
+        __slots__ = ("flag", "__doc__")
 
-    def __get__(self, instance: Optional[Flags], owner: Type[T]) -> Any:
-        return self if instance is None else bool(instance.value & self.flag)
+        def __init__(self, func):
+            mask = func(None)
 
-    def __set__(self, instance: Flags, value: bool) -> None:
-        if value:
-            instance.value |= self.flag
-        else:
-            instance.value &= ~self.flag
+            def getter(instance):
+                return bool(instance.value & mask)
+
+            def setter(instance, value):
+                if value:
+                    instance.value |= mask
+                else:
+                    instance.value &= ~mask
+
+            super().__init__(getter, setter)
+            self.flag = mask
+            self.__doc__ = func.__doc__
 
 
 class Flags:
     __slots__ = ("value",)
+    # flag name -> bit, collected for each subclass when it is defined
+    _flags: ClassVar[Dict[str, int]] = {}
+    # every defined bit set, what all() returns
+    _all_mask: ClassVar[int] = 0
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        cls._flags = {
+            **cls._flags,
+            **{
+                name: value.flag
+                for name, value in cls.__dict__.items()
+                if isinstance(value, flag)
+            },
+        }
+        mask = 0
+        for bit in cls._flags.values():
+            mask |= bit
+        cls._all_mask = mask
 
     def __init__(self, value: int = 0, **kwargs: bool) -> None:
-        self.value: int = value
+        self.value: int = self._apply(value, kwargs) if kwargs else value
 
-        if kwargs:
-            for key, value in kwargs.items():
-                setattr(self, key, value)
+    @classmethod
+    def _apply(cls, value: int, kwargs: Dict[str, bool], /) -> int:
+        flags = cls._flags
+        for name, enabled in kwargs.items():
+            try:
+                bit = flags[name]
+            except KeyError:
+                raise TypeError(
+                    f"{name!r} is not a valid {cls.__name__} flag"
+                ) from None
+            value = value | bit if enabled else value & ~bit
+        return value
 
     @classmethod
     def from_kwargs(cls, **kwargs: bool) -> Flags:
-        flags = cls(0)
-        for flag, value in kwargs.items():
-            setattr(flags, flag, value)
-        return flags
+        return cls(cls._apply(0, kwargs))
 
     @classmethod
     def none(cls: Type[T]) -> T:
@@ -80,10 +128,12 @@ class Flags:
 
     @classmethod
     def all(cls: Type[T]) -> T:
-        return cls(-1)
+        return cls(cls._all_mask)
 
 
 class Intents(Flags):
+    __slots__ = ()
+
     @flag
     def guilds(self) -> int:
         return 1 << 0
@@ -154,6 +204,8 @@ class Intents(Flags):
 
 
 class SystemChannelFlags(Flags):
+    __slots__ = ()
+
     @flag
     def suppress_join_notifications(self) -> int:
         return 1 << 0
@@ -172,6 +224,8 @@ class SystemChannelFlags(Flags):
 
 
 class Permissions(Flags):
+    __slots__ = ()
+
     @flag
     def create_instant_invite(self) -> int:
         return 1 << 0
@@ -25,7 +25,6 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
-import json
 import random
 import sys
 import time
@@ -34,13 +33,14 @@ from typing import TYPE_CHECKING
 
 import aiohttp
 
+from . import utils
 from .errors import InvalidSessionError
 from .missing import MISSING
 
 __all__ = ("GatewayHandler",)
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, List, Optional, Union
+    from typing import Any, Callable, Coroutine, Dict, List, Optional, Union
     from zlib import _Decompress  # type: ignore
 
     from .bot import Bot
@@ -54,6 +54,17 @@ if TYPE_CHECKING:
     )
     from .types.snowflake import Snowflake
 
+IDENTIFY_PROPERTIES: Dict[str, str] = {
+    "$os": sys.platform,
+    "$browser": "quarrel",
+    "$device": "quarrel",
+}
+
+CLOSE_MESSAGE_TYPES = frozenset(
+    (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSE)
+)
+DATA_MESSAGE_TYPES = frozenset((aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY))
+
 
 class GatewayClosure(Exception):
     def __init__(self, close_code: Optional[int]) -> None:
@@ -69,7 +80,8 @@ class Heartbeat:
         self.handler: GatewayHandler = handler
         self.socket: aiohttp.ClientWebSocketResponse = handler.gateway.socket
         self.interval: float = interval
-        self.stop_event: asyncio.Event = asyncio.Event()
+        self.stopped: bool = False
+        self.timer: Optional[asyncio.TimerHandle] = None
         self.last_send: float = time.perf_counter()
 
     async def send(self) -> None:
@@ -81,34 +93,29 @@ class Heartbeat:
             await self.handler.close_and_resume()
             return
         await self.handler.gateway.socket.send_json(
-            {"op": 1, "d": self.handler.sequence}
+            {"op": 1, "d": self.handler.sequence}, dumps=utils.to_json
         )
 
-    async def task(self, with_jitter: bool = False) -> None:
-        if with_jitter:
-            try:
-                await asyncio.wait_for(
-                    self.stop_event.wait(), timeout=self.interval * random.random()
-                )
-            except asyncio.TimeoutError:
-                await self.send()
-                self.last_send = time.perf_counter()
-            else:
-                return
-        while True:
-            try:
-                await asyncio.wait_for(self.stop_event.wait(), timeout=self.interval)
-            except asyncio.TimeoutError:
-                await self.send()
-                self.last_send = time.perf_counter()
-            else:
-                break
+    async def beat(self) -> None:
+        await self.send()
+        self.last_send = time.perf_counter()
+
+    def tick(self) -> None:
+        if self.stopped:
+            return
+        # the next beat is scheduled up front, a single timer handle per beat
+        # rather than a wait_for future and timeout callback
+        self.timer = self.handler.loop.call_later(self.interval, self.tick)
+        self.handler.loop.create_task(self.beat())
 
     def start(self, with_jitter: bool = False) -> None:
-        self.handler.loop.create_task(self.task(with_jitter))
+        delay = self.interval * random.random() if with_jitter else self.interval
+        self.timer = self.handler.loop.call_later(delay, self.tick)
 
     def stop(self) -> None:
-        self.stop_event.set()
+        self.stopped = True
+        if self.timer is not None:
+            self.timer.cancel()
 
 
 class GatewayRatelimiter:
@@ -119,18 +126,20 @@ class GatewayRatelimiter:
         self.lock: asyncio.Lock = asyncio.Lock()
 
     async def __aenter__(self) -> GatewayRatelimiter:
-        await self.lock.acquire()
-        now = time.perf_counter()
-        if self.start + 60 < now:
-            self.start = now
-            self.sent = 0
-        if self.sent > self.amount:
-            await asyncio.sleep(self.start + 60 - now)
-        self.sent += 1
-        return self
+        while True:
+            now = time.perf_counter()
+            if self.start + 60 < now:
+                self.start = now
+                self.sent = 0
+            if self.sent < self.amount:
+                self.sent += 1
+                return self
+            # only senders that have to wait out the window touch the lock
+            async with self.lock:
+                await asyncio.sleep(self.start + 60 - time.perf_counter())
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        self.lock.release()
+        ...
 
 
 class Gateway:
@@ -163,13 +172,9 @@ class Gateway:
     async def receive(self) -> GatewayDispatch:
         try:
             message = await self.socket.receive()
-            if message.type in {  # type: ignore
-                aiohttp.WSMsgType.CLOSED,
-                aiohttp.WSMsgType.CLOSING,
-                aiohttp.WSMsgType.CLOSE,
-            }:
+            if message.type in CLOSE_MESSAGE_TYPES:  # type: ignore
                 raise GatewayClosure(self.socket.close_code)
-            elif message.type in {aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY}:  # type: ignore
+            elif message.type in DATA_MESSAGE_TYPES:  # type: ignore
                 return self.parse_gateway_message(message.data)  # type: ignore
             raise UnknownGatewayMessageType(message)
         except (asyncio.TimeoutError, GatewayClosure):
@@ -178,7 +183,7 @@ class Gateway:
     async def send(self, op: int, data: Any) -> None:
         async with self.ratelimiter:
             try:
-                await self.socket.send_json({"op": op, "d": data})
+                await self.socket.send_json({"op": op, "d": data}, dumps=utils.to_json)
             except Exception as e:
                 if self.socket.closed:
                     raise GatewayClosure(self.socket.close_code) from e
@@ -188,13 +193,18 @@ class Gateway:
         self, data: Union[bytes, str]
     ) -> Optional[GatewayDispatch]:
         if type(data) is bytes:
-            self._buffer.extend(data)
-            if len(data) < 4 or data[-4:] != b"\x00\x00\xff\xff":
+            if not data.endswith(b"\x00\x00\xff\xff"):
+                self._buffer.extend(data)
                 return
-            data = self._decompress.decompress(self._buffer)
-            data = data.decode("utf-8")
-            self._buffer = bytearray()
-        return json.loads(data)
+            # both parsers take the decompressed bytes directly
+            if self._buffer:
+                self._buffer.extend(data)
+                data = self._decompress.decompress(self._buffer)
+                self._buffer.clear()
+            else:
+                # almost every message fits in one frame, no need to copy it
+                data = self._decompress.decompress(data)
+        return utils.from_json(data)
 
     async def close(self, code: int, message: Missing[str] = MISSING) -> None:
         await self.socket.close(code=code, message=(message or "").encode())
@@ -225,6 +235,15 @@ class GatewayHandler:
         self.acked: bool = True
         self.last_received: float = time.perf_counter()
 
+        # Dispatch (op 0) is handled inline by handle_message
+        self.handlers: Dict[int, Callable[[Any], Coroutine[Any, Any, None]]] = {
+            1: self.handle_heartbeat,  # Heartbeat
+            7: self.handle_reconnect,  # Reconnect
+            9: self.handle_invalid_session,  # Invalid Session
+            10: self.handle_hello,  # Hello
+            11: self.handle_heartbeat_ack,  # Heartbeat ACK
+        }
+
     async def __aenter__(self) -> GatewayHandler:
         return self
 
@@ -262,7 +281,6 @@ class GatewayHandler:
     ) -> Optional[GatewayDispatch]:
         self.last_received = time.perf_counter()
         op = message["op"]
-        data = message["d"]
         sequence = message.get("s")
 
         if sequence is not None:
@@ -272,25 +290,9 @@ class GatewayHandler:
         if op == 0:
             return message
 
-        # Heartbeat
-        if op == 1:
-            return await self.handle_heartbeat(data)
-
-        # Reconnect
-        if op == 7:
-            return await self.handle_reconnect(data)
-
-        # Invalid Session
-        if op == 9:
-            return await self.handle_invalid_session(data)  # type: ignore
-
-        # Hello
-        if op == 10:
-            return await self.handle_hello(data)
-
-        # Heartbeat ACK
-        if op == 11:
-            return await self.handle_heartbeat_ack(data)
+        handler = self.handlers.get(op)
+        if handler is not None:
+            await handler(message["d"])
 
     async def handle_heartbeat(self, data: Dict[str, Any]) -> None:
         if self.heartbeat is None:
@@ -327,11 +329,7 @@ class GatewayHandler:
     async def identify(self) -> None:
         data: IdentifyPayloadData = {
             "token": self.bot.token,
-            "properties": {
-                "$os": sys.platform,
-                "$browser": "quarrel",
-                "$device": "quarrel",
-            },
+            "properties": IDENTIFY_PROPERTIES,
             "compress": True,
             "large_threshold": 250,
             "intents": self.bot.intents.value,
@@ -25,13 +25,15 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
-import datetime
+import random
 import sys
+import time
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 import aiohttp
 
-from . import __version__
+from . import __version__, utils
 from .errors import (
     BadRequest,
     Forbidden,
@@ -45,15 +47,27 @@ from .missing import MISSING
 
 __all__ = ("HTTP",)
 
+STATUS_EXCEPTIONS = {
+    400: BadRequest,
+    401: Unauthorized,
+    403: Forbidden,
+    404: NotFound,
+    405: MethodNotAllowed,
+}
+# retried with a backoff before giving up with ServerError
+RETRY_STATUSES = frozenset((500, 502, 504))
+
 if TYPE_CHECKING:
     from typing import (
         Any,
         ClassVar,
         Coroutine,
         Dict,
+        List,
         Mapping,
         Optional,
         Sequence,
+        Tuple,
         Type,
         TypeVar,
         Union,
@@ -72,6 +86,10 @@ if TYPE_CHECKING:
 
     T = TypeVar("T")
     Response = Coroutine[Any, Any, T]
+    # bucket or route, then the major parameters
+    BucketKey = Tuple[
+        Optional[str], Optional[int], Optional[int], Optional[int], Optional[str]
+    ]
 
 
 class Bucket:
@@ -79,33 +97,46 @@ class Bucket:
         "http",
         "route_key",
         "key",
-        "release_immediately",
         "lock",
+        "pending",
         "limit",
         "remaining",
         "reset",
         "reset_after",
+        "deadline",
         "bucket",
         "global_",
     )
 
-    def __init__(self, http: HTTP, route_key: str, key: str, global_: bool, /) -> None:
+    def __init__(
+        self, http: HTTP, route_key: str, key: BucketKey, global_: bool, /
+    ) -> None:
         self.http: HTTP = http
         self.route_key: str = route_key
-        self.key: str = key
-        self.release_immediately: bool = True
+        self.key: BucketKey = key
         self.lock: asyncio.Lock = asyncio.Lock()
+        # requests holding or waiting on the bucket, it can expire at zero
+        self.pending: int = 0
         self.limit: Optional[int] = None
         self.remaining: Optional[int] = None
         self.reset: Optional[float] = None
         self.reset_after: Optional[float] = None
+        # loop.time() at which the current window resets
+        self.deadline: Optional[float] = None
         self.bucket: Optional[str] = None
         self.global_: bool = global_
 
     async def __aenter__(self) -> Bucket:
-        await self.lock.acquire()
-        if self.http.global_ratelimit.is_set() and self.global_:
-            await self.http.global_ratelimit.wait()
+        self.pending += 1
+        try:
+            # wait out a global ratelimit before queueing on the bucket so other
+            # waiters aren't held behind the lock for the whole global window
+            if self.global_ and self.http.globally_ratelimited:
+                await self.http.global_ratelimit.wait()
+            await self.lock.acquire()
+        except BaseException:
+            self.pending -= 1
+            raise
         return self
 
     async def __aexit__(
@@ -114,52 +145,37 @@ class Bucket:
         exc_value: Optional[BaseException],
         traceback: Optional[Any],
     ) -> None:
-        if self.release_immediately:
-            self.release()
+        self.release()
 
     def delay_amount(self) -> float:
-        utc = datetime.timezone.utc
-        now = datetime.datetime.now(utc)
-        if self.reset_after is None and self.reset is None:
+        if self.deadline is None:
             return 0
-        return (
-            self.reset_after
-            or (
-                datetime.datetime.fromtimestamp(
-                    # self.reset will never be None here
-                    float(self.reset),  # type: ignore
-                    utc,
-                )
-                - now
-            ).total_seconds()
-        )
+        return max(0.0, self.deadline - self.http.loop.time())
 
-    def delay_release(self) -> None:
-        self.release_immediately = False
-        self.http.loop.call_later(self.delay_amount(), self.release)
+    async def wait_for_reset(self) -> None:
+        # the bucket is exhausted, sleep out the window instead of sending a
+        # request that's bound to come back as a 429
+        if self.remaining == 0:
+            delay = self.delay_amount()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.remaining = self.limit
 
     def release(self) -> None:
         self.lock.release()
-        if not self.lock._waiters and not self.lock.locked():  # type: ignore
-            if self.delay_amount() > 0:
-                self.http.loop.call_later(self.delay_amount(), self.expire)
+        self.pending -= 1
+        if not self.pending:
+            delay = self.delay_amount()
+            if delay > 0:
+                self.http.loop.call_later(delay, self.expire)
             else:
                 self.expire()
 
     def expire(self) -> None:
-        if not self.lock._waiters and not self.lock.locked():  # type: ignore
+        # a stale expiry mustn't drop a newer bucket under the same key
+        if not self.pending and self.http.buckets.get(self.key) is self:
             del self.http.buckets[self.key]
 
-    @staticmethod
-    def bucket_key(
-        bucket: Optional[str],
-        channel_id: Optional[int] = None,
-        guild_id: Optional[int] = None,
-        webhook_id: Optional[int] = None,
-        webhook_token: Optional[str] = None,
-    ) -> str:
-        return f"{bucket}___{channel_id}/{guild_id}/{webhook_id}/{webhook_token}"
-
     @classmethod
     def from_major_parameters(
         cls,
@@ -172,12 +188,12 @@ class Bucket:
         webhook_id: Optional[int] = None,
         webhook_token: Optional[str] = None,
     ) -> Bucket:
-        key = cls.bucket_key(
+        key: BucketKey = (
             http.route_buckets.get(route_key, route_key),
-            channel_id=channel_id,
-            guild_id=guild_id,
-            webhook_id=webhook_id,
-            webhook_token=webhook_token,
+            channel_id,
+            guild_id,
+            webhook_id,
+            webhook_token,
         )
         bucket_ = http.buckets.get(key)
         if bucket_ is None:
@@ -200,15 +216,16 @@ class Bucket:
         reset_after = response.headers.get("X-RateLimit-Reset-After")
         if reset_after is not None:
             self.reset_after = float(reset_after)
+            self.deadline = self.http.loop.time() + self.reset_after
+        elif reset is not None:
+            self.deadline = self.http.loop.time() + float(reset) - time.time()
         bucket = response.headers.get("X-RateLimit-Bucket")
         if bucket is not None and self.bucket is None:
             self.bucket = bucket
             self.http.route_buckets[self.route_key] = bucket
             self.http.buckets.pop(self.key)
-            self.key = bucket + self.key.split("___")[1]
+            self.key = (bucket, *self.key[1:])
             self.http.buckets[self.key] = self
-        if self.remaining == 0:
-            self.delay_release()
         if response.status == 429:
             if isinstance(data, str):
                 raise HTTPException(response, data)
@@ -216,14 +233,19 @@ class Bucket:
                 "X-RateLimit-Global"
             ) is not None and data.get("global")
             if global_:
-                self.http.global_ratelimit.set()
+                self.http.globally_ratelimited = True
+                self.http.global_ratelimit.clear()
             await asyncio.sleep(data["retry_after"])
             if global_:
-                self.http.global_ratelimit.clear()
+                self.http.globally_ratelimited = False
+                self.http.global_ratelimit.set()
 
 
 class HTTP:
     BASE_URL: ClassVar[str] = "https://discord.com/api/v10"
+    MAX_RETRIES: ClassVar[int] = 3
+    # total seconds a request may spend backing off between retries
+    RETRY_BUDGET: ClassVar[float] = 60.0
     USER_AGENT: ClassVar[str] = f"DiscordBot (https://github.com/mrvillage/quarrel {__version__}) Python/{sys.version_info[0]}.{sys.version_info[1]} aiohttp/{aiohttp.__version__}"  # type: ignore
 
     def __init__(
@@ -237,16 +259,36 @@ class HTTP:
         self.session: aiohttp.ClientSession = session
         self.token: str = token
         self.application_id: int = application_id
+        # route parameters for endpoints that only need the application id
+        self.application_parameters: Mapping[str, Any] = MappingProxyType(
+            {"application_id": application_id}
+        )
         self.loop: asyncio.AbstractEventLoop = loop
 
-        self.buckets: Dict[str, Bucket] = {}
+        self.buckets: Dict[BucketKey, Bucket] = {}
+        # set while requests are free to go, cleared during a global ratelimit
         self.global_ratelimit: asyncio.Event = asyncio.Event()
+        self.global_ratelimit.set()
+        # mirrors the event so the common case is a plain attribute check
+        self.globally_ratelimited: bool = False
         self.headers = {
             "User-Agent": self.USER_AGENT,
             "Authorization": f"Bot {self.token}",
         }
         self.route_buckets: Dict[str, str] = {}
 
+    @staticmethod
+    def build_session(
+        *, limit: int = 1024, limit_per_host: int = 64
+    ) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        )
+        return aiohttp.ClientSession(connector=connector, json_serialize=utils.to_json)
+
     async def request(
         self,
         method: str,
@@ -257,58 +299,83 @@ class HTTP:
         global_: bool = True,
         **kwargs: Any,
     ) -> Any:
-        route_parameters = route_parameters or {}
+        upload: Optional[List[File]] = None
+        payload_json: Optional[str] = None
         if files is not MISSING:
-            form_data = aiohttp.FormData()
-            form_data.add_field(name="payload_json", value=kwargs.pop("json"))
-            for index, file in enumerate(files):
-                form_data.add_field(
-                    name=f"file{index}",
-                    value=file.buffer,
-                    filename=file.name,
-                    content_type="application/octet-stream",
-                )
-            kwargs["form"] = form_data
-        url = f"{self.BASE_URL}{path.format_map(route_parameters)}"
-        async with Bucket.from_major_parameters(
-            self,
-            method + path,
-            global_,
-            channel_id=route_parameters.get("channel_id"),
-            guild_id=route_parameters.get("guild_id"),
-            webhook_id=route_parameters.get("webhook_id"),
-            webhook_token=route_parameters.get("webhook_token"),
-        ) as bucket:
+            upload = list(files)
+            # serialized once, the form itself can only be sent once
+            json = kwargs.pop("json", None)
+            if json is not None:
+                payload_json = utils.to_json(json)
+        if route_parameters is MISSING:
+            url = self.BASE_URL + path
+            bucket = Bucket.from_major_parameters(self, method + path, global_)
+        else:
+            url = self.BASE_URL + path.format_map(route_parameters)
+            bucket = Bucket.from_major_parameters(
+                self,
+                method + path,
+                global_,
+                channel_id=route_parameters.get("channel_id"),
+                guild_id=route_parameters.get("guild_id"),
+                webhook_id=route_parameters.get("webhook_id"),
+                webhook_token=route_parameters.get("webhook_token"),
+            )
+        async with bucket:
             response = None
             data = None
-            for try_ in range(3):
-                async with self.session.request(
-                    method, url, headers=self.headers, **kwargs
+            session_request = self.session.request
+            headers = self.headers
+            waited = 0.0
+            for try_ in range(self.MAX_RETRIES):
+                await bucket.wait_for_reset()
+                if upload is not None:
+                    form_data = aiohttp.FormData()
+                    if payload_json is not None:
+                        form_data.add_field(
+                            name="payload_json",
+                            value=payload_json,
+                            content_type="application/json",
+                        )
+                    for index, file in enumerate(upload):
+                        form_data.add_field(
+                            name=f"file{index}",
+                            value=file.buffer,
+                            filename=file.name,
+                            content_type="application/octet-stream",
+                        )
+                    kwargs["data"] = form_data
+                async with session_request(
+                    method, url, headers=headers, **kwargs
                 ) as response:
-                    if response.headers["content-type"] == "application/json":
-                        data = await response.json()
+                    if response.content_type == "application/json":
+                        data = await response.json(loads=utils.from_json)
                     else:
                         data = await response.text()
                     await bucket.handle_ratelimit(response, data)
-                    if 300 > response.status >= 200:
+                    status = response.status
+                    if 300 > status >= 200:
                         return data
-                    if response.status == 400:
-                        raise BadRequest(response, data)
-                    if response.status == 401:
-                        raise Unauthorized(response, data)
-                    if response.status == 403:
-                        raise Forbidden(response, data)
-                    if response.status == 404:
-                        raise NotFound(response, data)
-                    if response.status == 405:
-                        raise MethodNotAllowed(response, data)
-                    if response.status in {500, 502, 504}:
-                        await asyncio.sleep(1 + try_)
+                    if status == 429:
+                        continue
+                    exc = STATUS_EXCEPTIONS.get(status)
+                    if exc is not None:
+                        raise exc(response, data)
+                    if status in RETRY_STATUSES:
+                        # exponential backoff, jittered so concurrent retries spread out
+                        delay = min(30.0, 0.5 * 2**try_) + random.random() * 0.5
+                        # don't sleep when there's no retry left to sleep for
+                        if (
+                            try_ + 1 == self.MAX_RETRIES
+                            or waited + delay > self.RETRY_BUDGET
+                        ):
+                            raise ServerError(response, data)
+                        waited += delay
+                        await asyncio.sleep(delay)
                         continue
-                    if response.status >= 500:
+                    if status >= 500:
                         raise ServerError(response, data)
-                    if response.status != 429:
-                        raise HTTPException(response, data)
+                    raise HTTPException(response, data)
             if response is not None:
                 if response.status >= 500:
                     raise ServerError(response, data)
@@ -329,7 +396,7 @@ class HTTP:
         return self.request(
             "PUT",
             "/applications/{application_id}/commands",
-            {"application_id": self.application_id},
+            self.application_parameters,
             json=commands,
         )
 
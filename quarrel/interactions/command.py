@@ -48,6 +48,7 @@ if TYPE_CHECKING:
     from typing import (
         Any,
         Callable,
+        ClassVar,
         Coroutine,
         Dict,
         Final,
@@ -55,6 +56,7 @@ if TYPE_CHECKING:
         Optional,
         Sequence,
         Set,
+        Tuple,
         Type,
         cast,
     )
@@ -117,6 +119,15 @@ def check(
     return decorator
 
 
+def _is_slot_name(name: str) -> bool:
+    # __x names would be mangled by type(), so only dunders may start with __
+    return (
+        name.isidentifier()
+        and (not name.startswith("__") or name.endswith("__"))
+        and name not in {"__dict__", "__weakref__"}
+    )
+
+
 class SlashCommand(Generic[OPTS]):
     type: Final = ApplicationCommandType.CHAT_INPUT
     name: str
@@ -124,8 +135,13 @@ class SlashCommand(Generic[OPTS]):
     guilds: Set[int]
     global_: bool
     command_options: List[OptionType[OPTS]]
+    # command_options by name and each check with the options it requires,
+    # kept alongside the lists so run_command doesn't rebuild them
+    command_parameters: ClassVar[Dict[str, OptionType[Any]]]
     parent: Optional[Type[SlashCommand[Any]]]
     checks: List[SlashCommandCheck[Any]]
+    check_requirements: List[Tuple[SlashCommandCheck[Any], List[str]]]
+    options_type: Type[Options]
 
     __slots__ = ("interaction", "options")
 
@@ -148,13 +164,35 @@ class SlashCommand(Generic[OPTS]):
         cls.command_options = [
             j for i in cls.__mro__ for j in getattr(i, "command_options", [])
         ] + (options or [])
+        cls.command_parameters = {i.name: i for i in cls.command_options}
+        # slots for each option and its raw value, subcommands don't add any,
+        # names that can't be slots (like "user-id") live in the __dict__
+        cls.options_type = type(
+            f"{cls.__name__}Options",
+            (Options,),
+            {
+                "__slots__": tuple(
+                    dict.fromkeys(
+                        j
+                        for i in cls.command_options
+                        if isinstance(i, Option)
+                        for j in (i.attribute, i.raw_attribute)
+                        if _is_slot_name(j)
+                    )
+                )
+            },
+        )
         # pyright has issues unpacking Unions with Type inside
         cls.parent = parent or None  # type: ignore
         if cls.parent is not None:
             cls.parent.command_options.append(cls)
+            cls.parent.command_parameters[cls.name] = cls
         cls.checks = [j for i in cls.__mro__ for j in getattr(i, "checks", [])] + (
             checks or []
         )
+        cls.check_requirements = [
+            (i, getattr(i, "__check_requires__", [])) for i in cls.checks
+        ]
         # getattr call has Set[Unknown] as default
         cls.guilds = {j for i in cls.__mro__ for j in getattr(i, "guilds", set())} | (  # type: ignore
             guilds or set()
@@ -172,33 +210,33 @@ class SlashCommand(Generic[OPTS]):
             cls.command_options
             and cls.command_options[0].type is ApplicationCommandType.CHAT_INPUT
         ):
-            parameters: Dict[str, SlashCommand] = {i.name: i for i in cls.command_options}  # type: ignore
-            return await parameters[options_[0]["name"]].run_command(interaction, options_[0].get("options", []))  # type: ignore
-        options = Options()
+            return await cls.command_parameters[options_[0]["name"]].run_command(interaction, options_[0].get("options", []))  # type: ignore
+        options = cls.options_type()
+        # attributes already set on options, cheaper than a failing hasattr
+        assigned: Set[str] = set()
         self: SlashCommand[Any] = cls(interaction, options)
         arguments: Dict[str, Any] = {i["name"]: i for i in options_}  # type: ignore
-        parameters: Dict[str, Option] = {i.name: i for i in cls.command_options}  # type: ignore
-        for check in cls.checks:
-            requires: List[str] = getattr(check, "__check_requires__", [])
+        parameters: Dict[str, Option] = cls.command_parameters  # type: ignore
+        for check, requires in cls.check_requirements:
             for name in requires:
                 option = parameters[name]
-                if hasattr(options, option.attribute):
+                attribute = option.attribute
+                if attribute in assigned:
                     continue
+                assigned.add(attribute)
                 value = arguments.get(name, MISSING)
                 try:
-                    setattr(options, f"__quarrel_raw_{option.attribute}__", value)
+                    setattr(options, option.raw_attribute, value)
                     if value is MISSING:
                         default = option.default
                         if callable(default):
                             default = default(self)
                             if inspect.isawaitable(default):
                                 default = await default
-                        setattr(options, option.attribute, default)
+                        setattr(options, attribute, default)
                     else:
                         setattr(
-                            options,
-                            option.attribute,
-                            await option.parse(self, value["value"]),
+                            options, attribute, await option.parse(self, value["value"])
                         )
                 except Exception as e:
                     return await self.on_option_error(e, option, value)
@@ -208,11 +246,12 @@ class SlashCommand(Generic[OPTS]):
             except Exception as e:
                 return await self.on_check_error(e)
         for name, param in parameters.items():
-            if hasattr(options, param.attribute):
+            attribute = param.attribute
+            if attribute in assigned:
                 continue
             value = arguments.get(name, MISSING)
             try:
-                setattr(options, f"__quarrel_raw_{param.attribute}__", value)
+                setattr(options, param.raw_attribute, value)
                 if value is MISSING:
                     default = param.default
                     if callable(default):
@@ -220,13 +259,9 @@ class SlashCommand(Generic[OPTS]):
                             default = await default(self)
                         else:
                             default = default(self)
-                    setattr(options, param.attribute, default)
+                    setattr(options, attribute, default)
                 else:
-                    setattr(
-                        options,
-                        param.attribute,
-                        await param.parse(self, value["value"]),
-                    )
+                    setattr(options, attribute, await param.parse(self, value["value"]))
             except Exception as e:
                 return await self.on_option_error(e, param, value)
         try:
@@ -307,6 +342,7 @@ class SlashCommand(Generic[OPTS]):
         setattr(func, "__check_requires__", requires)
         setattr(func, "__check_after_options__", after_options)
         cls.checks.append(func)
+        cls.check_requirements.append((func, requires))
         return cls
 
     @classmethod
@@ -505,6 +541,44 @@ class MessageCommand:
         return decorator
 
 
+def _resolve_mentionable(interaction: Interaction, value: Any) -> Any:
+    id = int(value)
+    if interaction.guild_id is not MISSING:
+        if m := interaction.get_member_from_resolved(id):
+            return m
+        if r := interaction.get_role_from_resolver(id):
+            return r
+    elif u := interaction.get_user_from_resolved(id):
+        return u
+    return value
+
+
+def _resolve_channel(interaction: Interaction, value: Any) -> Any:
+    return interaction.get_channel_from_resolved(int(value)) or value
+
+
+def _resolve_user(interaction: Interaction, value: Any) -> Any:
+    id = int(value)
+    return (
+        interaction.get_member_from_resolved(id)
+        or interaction.get_user_from_resolved(id)
+        or value
+    )
+
+
+def _resolve_role(interaction: Interaction, value: Any) -> Any:
+    return interaction.get_role_from_resolver(int(value)) or value
+
+
+# option types whose raw value is an id to look up in the resolved data
+_RESOLVERS: Dict[ApplicationCommandOptionType, Callable[[Interaction, Any], Any]] = {
+    ApplicationCommandOptionType.MENTIONABLE: _resolve_mentionable,
+    ApplicationCommandOptionType.CHANNEL: _resolve_channel,
+    ApplicationCommandOptionType.USER: _resolve_user,
+    ApplicationCommandOptionType.ROLE: _resolve_role,
+}
+
+
 class Option:
     __slots__ = (
         "type",
@@ -518,6 +592,8 @@ class Option:
         "max_value",
         "autocomplete",
         "attribute",
+        "raw_attribute",
+        "resolver",
     )
 
     def __init__(
@@ -551,6 +627,10 @@ class Option:
         self.max_value: Missing[float] = max_value
         self.autocomplete: Missing[bool] = autocomplete
         self.attribute: str = attribute or name
+        self.raw_attribute: str = f"__quarrel_raw_{self.attribute}__"
+        self.resolver: Optional[Callable[[Interaction, Any], Any]] = _RESOLVERS.get(
+            type
+        )
 
     async def autocomplete_callback(self, command: SlashCommand[Any]) -> Any:
         ...
@@ -580,30 +660,8 @@ class Option:
         return payload
 
     async def parse(self, command: SlashCommand[Any], value: Any) -> Any:
-        interaction = command.interaction
-        if self.type is ApplicationCommandOptionType.MENTIONABLE:
-            id = int(value)
-            if interaction.guild_id is not MISSING:
-                if m := interaction.get_member_from_resolved(id):
-                    value = m
-                elif r := interaction.get_role_from_resolver(id):
-                    value = r
-            elif u := interaction.get_user_from_resolved(id):
-                value = u
-        elif self.type is ApplicationCommandOptionType.CHANNEL:
-            id = int(value)
-            if c := interaction.get_channel_from_resolved(id):
-                value = c
-        elif self.type is ApplicationCommandOptionType.USER:
-            id = int(value)
-            if m := interaction.get_member_from_resolved(id):
-                value = m
-            elif u := interaction.get_user_from_resolved(id):
-                value = u
-        elif self.type is ApplicationCommandOptionType.ROLE:
-            id = int(value)
-            if r := interaction.get_role_from_resolver(id):
-                value = r
+        if self.resolver is not None:
+            value = self.resolver(command.interaction, value)
         if self.converters:
             errors: List[Exception] = []
             for converter in self.converters:
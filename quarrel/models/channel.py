@@ -97,6 +97,7 @@ class _BaseChannel:
     _state: State
     type: ChannelType
     __slots__ = ("id", "_state", "type")
+    __copy__ = utils.copy_slots
 
     async def create_message(
         self,
@@ -209,10 +209,12 @@ class Guild:
             VoiceState(i, self._state) for i in data.get("voice_states", [])
         ]
         self._voice_states: Dict[int, VoiceState] = {v.user_id: v for v in voice_states}
-        members = [
-            Member(i, MISSING, self, self._state) for i in data.get("members", [])
-        ]
-        self._members: Dict[int, Member] = {m.id: m for m in members}
+        # members can number in the hundreds of thousands, so they go straight
+        # into the dict instead of through an intermediate list
+        self._members: Dict[int, Member] = {}
+        for i in data.get("members", []):
+            member = Member(i, MISSING, self, self._state)
+            self._members[member.id] = member
         channels = [
             GuildChannelFactory(i, self, self._state)
             for i in [*data.get("channels", []), *data.get("threads", [])]
@@ -228,27 +230,29 @@ class Guild:
     async def chunk(self) -> None:
         self._chunk_event = asyncio.Event()
         nonce = secrets.token_hex(16)
+        queue: asyncio.Queue[GuildMembersChunk] = asyncio.Queue()
+        self._state.bot.event_handler.chunks_queue[nonce] = queue
         await self._state.bot.gateway_handler.request_guild_members(
             self, nonce=nonce, presences=self._state.bot.intents.presences
         )
-        queue: asyncio.Queue[GuildMembersChunk] = asyncio.Queue()
-        self._state.bot.event_handler.chunks_queue[(self.id, nonce)] = queue
-        chunks: List[GuildMembersChunk] = []
+        # chunks are consumed as they arrive so the queue never holds more than
+        # the gateway has delivered since the last one was processed
+        members = self._members
+        state = self._state
+        received = 0
         while True:
             try:
                 chunk = await asyncio.wait_for(queue.get(), timeout=15)
             except asyncio.TimeoutError:
                 break
-            chunks.append(chunk)
-            if len(chunks) == chunk["chunk_count"]:
+            for member in chunk["members"]:
+                mem = Member(member, MISSING, self, state)
+                members[mem.id] = mem
+            received += 1
+            if received == chunk["chunk_count"]:
                 break
 
-        self._state.bot.event_handler.chunks_queue.pop((self.id, nonce))
-
-        for chunk in chunks:
-            for member in chunk["members"]:
-                mem = Member(member, MISSING, self, self._state)
-                self._members[mem.id] = mem
+        self._state.bot.event_handler.chunks_queue.pop(nonce)
         self._chunk_event.set()
         self._chunk_event = None
 
@@ -26,6 +26,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from .. import utils
 from ..asset import Asset
 from ..flags import Permissions
 from ..missing import MISSING
@@ -62,6 +63,7 @@ class Member:
         "pending",
         "user",
     )
+    __copy__ = utils.copy_slots
 
     def __init__(
         self,
@@ -26,6 +26,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
+from .. import utils
 from ..flags import Permissions
 from ..missing import MISSING
 
@@ -55,6 +56,7 @@ class Role:
         "_unicode_emoji",
         "_tags",
     )
+    __copy__ = utils.copy_slots
 
     def __init__(self, data: RoleData, guild: Guild, state: State) -> None:
         self.guild: Guild = guild
@@ -56,6 +56,7 @@ class User:
         "email",
         "public_flags",
     )
+    __copy__ = utils.copy_slots
 
     def __init__(self, data: UserData, state: State) -> None:
         self._state: State = state
@@ -25,13 +25,20 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import datetime
+import json
+import re
 import secrets
 import sys
 import traceback
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from .missing import MISSING
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 __all__ = (
     "get_int_or_none",
     "get_int_or_missing",
@@ -42,14 +49,25 @@ __all__ = (
     "print_exception",
     "generate_custom_id",
     "update_or_current",
+    "copy_slots",
+    "from_json",
+    "to_json",
+    "PatternMatcher",
 )
 
 if TYPE_CHECKING:
-    from typing import Any, Optional, TypeVar
+    from typing import Any, Dict, List, Optional, Tuple, Type
 
     from .missing import Missing
 
-    T = TypeVar("T")
+T = TypeVar("T")
+
+# numbered backreferences and conditionals would point at the wrong group
+# once a pattern is embedded in the combined alternation
+_NUMBERED_REFERENCE = re.compile(r"\\[1-9]|\(\?\(\d")
+_NAMED_GROUP = re.compile(r"(?<!\\)\(\?P(<|=)(\w+)")
+
+_SLOT_NAMES: Dict[Type[Any], Tuple[str, ...]] = {}
 
 
 def get_int_or_none(value: Optional[Any]) -> Optional[int]:
@@ -91,3 +109,100 @@ def generate_custom_id(length: int = 100) -> str:
 
 def update_or_current(updated: T, new: Missing[T]) -> T:
     return updated if new is MISSING else new
+
+
+def copy_slots(obj: T, /) -> T:
+    # used as __copy__ on the slotted models, much cheaper than the generic
+    # __reduce_ex__ path copy.copy takes otherwise
+    cls = type(obj)
+    names = _SLOT_NAMES.get(cls)
+    if names is None:
+        names = _SLOT_NAMES[cls] = tuple(
+            name
+            for klass in cls.__mro__
+            for name in klass.__dict__.get("__slots__", ())
+            if name not in {"__dict__", "__weakref__"}
+        )
+    new = cls.__new__(cls)
+    for name in names:
+        try:
+            setattr(new, name, getattr(obj, name))
+        except AttributeError:
+            # slot was never assigned
+            pass
+    return new
+
+
+if orjson is None:
+    from_json = json.loads
+    to_json = json.dumps
+else:
+    from_json = orjson.loads  # type: ignore
+
+    def to_json(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")  # type: ignore
+
+
+class PatternMatcher(Generic[T]):
+    __slots__ = ("patterns", "combined", "groups", "compiled")
+
+    def __init__(self, patterns: Dict[re.Pattern[str], T]) -> None:
+        self.patterns: Dict[re.Pattern[str], T] = patterns
+        self.combined: Optional[re.Pattern[str]] = None
+        self.groups: Dict[int, Tuple[re.Pattern[str], Dict[str, str]]] = {}
+        self.compiled: bool = False
+
+    def invalidate(self) -> None:
+        self.compiled = False
+
+    def compile(self) -> None:
+        self.compiled = True
+        self.combined = None
+        self.groups = {}
+        parts: List[str] = []
+        groups: Dict[int, Tuple[re.Pattern[str], Dict[str, str]]] = {}
+        index = 1
+        for pattern in self.patterns:
+            if pattern.flags != re.UNICODE or _NUMBERED_REFERENCE.search(
+                pattern.pattern
+            ):
+                return
+            # group names are prefixed so patterns reusing a name can coexist
+            prefix = f"_{index}_"
+            names: Dict[str, str] = {}
+
+            def rename(match: re.Match[str]) -> str:
+                names[prefix + match[2]] = match[2]
+                return f"(?P{match[1]}{prefix}{match[2]}"
+
+            source = _NAMED_GROUP.sub(rename, pattern.pattern)
+            if set(names.values()) != set(pattern.groupindex):
+                return
+            parts.append(f"({source})")
+            groups[index] = (pattern, names)
+            index += pattern.groups + 1
+        if not parts:
+            return
+        try:
+            self.combined = re.compile("|".join(parts))
+        except re.error:
+            return
+        self.groups = groups
+
+    def match(self, string: str, /) -> Optional[Tuple[T, Dict[str, Any]]]:
+        if not self.compiled:
+            self.compile()
+        if self.combined is None:
+            for pattern, value in self.patterns.items():
+                match = pattern.match(string)
+                if match is not None:
+                    return value, match.groupdict()
+            return None
+        match = self.combined.match(string)
+        if match is None:
+            return None
+        # the wrapping group of the matched pattern always closes last
+        pattern, names = self.groups[match.lastindex]  # type: ignore
+        return self.patterns[pattern], {
+            name: match.group(group) for group, name in names.items()
+        }
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from quarrel.enums import ApplicationCommandOptionType
+from quarrel.interactions.command import Option, SlashCommand
+from quarrel.interactions.interaction import Interaction
+from quarrel.models import User
+
+
+class FakeBot:
+    http = None
+
+
+class FakeState:
+    bot = FakeBot()
+
+    def get_guild(self, guild_id: int, /) -> Optional[Any]:
+        return None
+
+    def parse_user(self, data: Any, /) -> User:
+        return User(data, self)  # type: ignore
+
+
+def make_interaction(options: List[Dict[str, Any]]) -> Interaction:
+    payload: Dict[str, Any] = {
+        "id": "1",
+        "application_id": "2",
+        "type": 2,
+        "token": "token",
+        "channel_id": "3",
+        "user": {
+            "id": "4",
+            "username": "user",
+            "discriminator": "0001",
+            "avatar": None,
+        },
+        "data": {"id": "5", "name": "command", "type": 1, "options": options},
+    }
+    return Interaction(payload, FakeState())  # type: ignore
+
+
+def test_hyphenated_option_name() -> None:
+    results: List[Any] = []
+
+    class Command(
+        SlashCommand[Any],
+        name="command",
+        description="description",
+        options=[
+            Option(ApplicationCommandOptionType.STRING, "user-id", "description"),
+            Option(
+                ApplicationCommandOptionType.STRING,
+                "reason",
+                "description",
+                default=None,
+            ),
+        ],
+    ):
+        async def callback(self) -> None:
+            results.append(getattr(self.options, "user-id"))
+            results.append(self.options.reason)  # type: ignore
+
+    interaction = make_interaction([{"name": "user-id", "value": "123", "type": 3}])
+    asyncio.run(Command.run_command(interaction))
+    assert results == ["123", None]
+
+
+def test_resolved_options_without_resolved_payload() -> None:
+    results: List[Any] = []
+
+    class Command(
+        SlashCommand[Any],
+        name="command",
+        description="description",
+        options=[
+            Option(ApplicationCommandOptionType.USER, "user", "description"),
+            Option(ApplicationCommandOptionType.MENTIONABLE, "mention", "description"),
+            Option(ApplicationCommandOptionType.ROLE, "role", "description"),
+            Option(ApplicationCommandOptionType.CHANNEL, "channel", "description"),
+        ],
+    ):
+        async def callback(self) -> None:
+            options: Any = self.options
+            results.extend(
+                (options.user, options.mention, options.role, options.channel)
+            )
+
+    interaction = make_interaction(
+        [
+            {"name": "user", "value": "10", "type": 6},
+            {"name": "mention", "value": "11", "type": 9},
+            {"name": "role", "value": "12", "type": 8},
+            {"name": "channel", "value": "13", "type": 7},
+        ]
+    )
+    asyncio.run(Command.run_command(interaction))
+    # ids that aren't in the resolved data are passed through as given
+    assert results == ["10", "11", "12", "13"]